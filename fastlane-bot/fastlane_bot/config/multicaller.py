@@ -5,6 +5,7 @@ This is the multicaller module.
 (c) Copyright Bprotocol foundation 2023.
 Licensed under MIT
 """
+import re
 from functools import partial
 from typing import List, Callable, ContextManager, Any, Dict
 
@@ -15,6 +16,9 @@ from web3 import Web3
 from fastlane_bot.config.multiprovider import MultiProviderContractWrapper
 from fastlane_bot.data.abi import MULTICALL_ABI
 
+# extracts `name` from the repr of a queued call, eg "functools.partial(<Function name>, ...)"
+FN_NAME_PATTERN = re.compile(r"<Function (\w+)")
+
 
 def cast(typ, val):
     """Cast a value to a type.
@@ -117,6 +121,11 @@ class MultiCaller(ContextManager):
         self.block_identifier = block_identifier
         self.web3 = web3
         self.MULTICALL_CONTRACT_ADDRESS = self.web3.to_checksum_address(multicall_address)
+        # built once and reused by every multicall(); constructing a contract parses the whole ABI
+        self.multicall_contract = self.web3.eth.contract(
+            abi=MULTICALL_ABI,
+            address=self.MULTICALL_CONTRACT_ADDRESS
+        )
 
     def __enter__(self) -> 'MultiCaller':
         return self
@@ -132,9 +141,12 @@ class MultiCaller(ContextManager):
         output_types_list = []
         _calls_for_aggregate = {}
         _output_types_list = {}
+        output_types_by_fn_name = {}
         for fn in self._contract_calls:
-            fn_name = str(fn).split('functools.partial(<Function ')[1].split('>')[0]
-            output_types = get_output_types_from_abi(self.contract.abi, fn_name)
+            fn_name = FN_NAME_PATTERN.search(str(fn)).group(1)
+            if fn_name not in output_types_by_fn_name:
+                output_types_by_fn_name[fn_name] = get_output_types_from_abi(self.contract.abi, fn_name)
+            output_types = output_types_by_fn_name[fn_name]
             if fn_name in _calls_for_aggregate:
                 _calls_for_aggregate[fn_name].append({
                 'target': self.contract.address,
@@ -152,22 +164,10 @@ class MultiCaller(ContextManager):
             calls_for_aggregate += (_calls_for_aggregate[fn_list])
             output_types_list += (_output_types_list[fn_list])
 
-        _encoded_data = []
-
         function_keys = _calls_for_aggregate.keys()
-        for fn_list in function_keys:
-            _encoded_data.append(self.web3.eth.contract(
-                abi=MULTICALL_ABI,
-                address=self.MULTICALL_CONTRACT_ADDRESS
-            ).functions.aggregate(_calls_for_aggregate[fn_list]).call(block_identifier=self.block_identifier))
-
-        if not isinstance(_encoded_data[0], list):
-            raise TypeError(f"Expected encoded_data to be a list, got {type(_encoded_data[0])} instead.")
 
-        encoded_data = self.web3.eth.contract(
-            abi=MULTICALL_ABI,
-            address=self.MULTICALL_CONTRACT_ADDRESS
-        ).functions.aggregate(calls_for_aggregate).call(block_identifier=self.block_identifier)
+        # all calls, grouped by function name, go out in a single aggregate request
+        encoded_data = self.multicall_contract.functions.aggregate(calls_for_aggregate).call(block_identifier=self.block_identifier)
 
         if not isinstance(encoded_data, list):
             raise TypeError(f"Expected encoded_data to be a list, got {type(encoded_data)} instead.")
@@ -5,6 +5,7 @@ __VERSION__ = "1.0.3-RESTRICTED"
 __DATE__ = "02/May 2023"
 
 import os
+from functools import lru_cache
 from typing import List, Dict
 
 import pandas as pd
@@ -24,6 +25,14 @@ load_dotenv()  # take environment variables from .env.
 TENDERLY_FORK = os.environ.get("TENDERLY_FORK_ID")
 
 
+@lru_cache(maxsize=None)
+def _read_multichain_addresses(multichain_address_path: str) -> pd.DataFrame:
+    """
+    Read the multichain addresses file once per path; callers only ever get filtered copies
+    """
+    return pd.read_csv(multichain_address_path)
+
+
 def get_multichain_addresses(network: str):
     """
     Create dataframe of addresses for the selected network
@@ -32,10 +41,9 @@ def get_multichain_addresses(network: str):
     returns:
     A dataframe that contains items from the selected network
     """
-    multichain_address_path = os.path.normpath(
-        "fastlane_bot/data/multichain_addresses.csv"
+    chain_addresses_df = _read_multichain_addresses(
+        os.path.normpath("fastlane_bot/data/multichain_addresses.csv")
     )
-    chain_addresses_df = pd.read_csv(multichain_address_path)
     network_df = chain_addresses_df.loc[chain_addresses_df["chain"] == network]
     return network_df
 
@@ -307,24 +315,10 @@ class ConfigNetwork(ConfigBase):
         """
         if network is None:
             network = cls.NETWORK_ETHEREUM
-        if network == cls.NETWORK_ETHEREUM:
-            return _ConfigNetworkMainnet(_direct=False)
-        elif network == cls.NETWORK_BASE:
-            return _ConfigNetworkBase(_direct=False)
-        elif network == cls.NETWORK_ARBITRUM:
-            return _ConfigNetworkArbitrumOne(_direct=False)
-        elif network == cls.NETWORK_POLYGON:
-            return _ConfigNetworkPolygon(_direct=False)
-        elif network == cls.NETWORK_POLYGON_ZKEVM:
-            return _ConfigNetworkPolygonZkevm(_direct=False)
-        elif network == cls.NETWORK_OPTIMISM:
-            return _ConfigNetworkOptimism(_direct=False)
-        elif network == cls.NETWORK_FANTOM:
-            return _ConfigNetworkFantom(_direct=False)
-        elif network == cls.NETWORK_TENDERLY:
-            return _ConfigNetworkTenderly(_direct=False)
-        else:
+        network_class = NETWORK_CONFIG_CLASSES.get(network)
+        if network_class is None:
             raise ValueError(f"Invalid network: {network}")
+        return network_class(_direct=False)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -612,7 +606,6 @@ class _ConfigNetworkBase(ConfigNetwork):
     WEB3_ALCHEMY_PROJECT_ID = os.environ.get("WEB3_ALCHEMY_BASE")
 
     GAS_ORACLE_ADDRESS = "0x4200000000000000000000000000000000000015"
-    network_df = get_multichain_addresses(network="coinbase_base")
     FASTLANE_CONTRACT_ADDRESS = "0x2AE2404cD44c830d278f51f053a08F54b3756e1c"
     MULTICALL_CONTRACT_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
 
@@ -654,7 +647,6 @@ class _ConfigNetworkFantom(ConfigNetwork):
     RPC_ENDPOINT = "https://fantom.blockpi.network/v1/rpc/"
     WEB3_ALCHEMY_PROJECT_ID = os.environ.get("WEB3_FANTOM")
 
-    network_df = get_multichain_addresses(network=NETWORK_NAME)
     FASTLANE_CONTRACT_ADDRESS = "0xFe19CbA3aB1A189B7FC17cAa798Df64Ad2b54d4D"
     MULTICALL_CONTRACT_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
 
@@ -748,3 +740,15 @@ class _ConfigNetworkTenderly(ConfigNetwork):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+
+
+NETWORK_CONFIG_CLASSES = {
+    S.NETWORK_ETHEREUM: _ConfigNetworkMainnet,
+    S.NETWORK_BASE: _ConfigNetworkBase,
+    S.NETWORK_ARBITRUM: _ConfigNetworkArbitrumOne,
+    S.NETWORK_POLYGON: _ConfigNetworkPolygon,
+    S.NETWORK_POLYGON_ZKEVM: _ConfigNetworkPolygonZkevm,
+    S.NETWORK_OPTIMISM: _ConfigNetworkOptimism,
+    S.NETWORK_FANTOM: _ConfigNetworkFantom,
+    S.NETWORK_TENDERLY: _ConfigNetworkTenderly,
+}
@@ -1,7 +1,6 @@
 import asyncio
 import os
 import time
-from glob import glob
 from typing import Any, List, Dict, Tuple, Type, Callable
 
 import nest_asyncio
@@ -291,7 +290,8 @@ def get_token_contracts(
     tokens_df = pd.read_csv(
         f"fastlane_bot/data/blockchain_data/{mgr.blockchain}/tokens.csv"
     )
-    missing_tokens = [tkn for tkn in tokens if tkn not in tokens_df["address"].tolist()]
+    known_addresses = set(tokens_df["address"])
+    missing_tokens = [tkn for tkn in tokens if tkn not in known_addresses]
     contracts = []
     failed_contracts = []
     contracts.extend(
@@ -309,52 +309,32 @@ def get_token_contracts(
 
 
 def process_contract_chunks(
-        base_filename: str,
         chunks: List[Any],
-        dirname: str,
         filename: str,
         subset: List[str],
         func: Callable,
         df_combined: pd.DataFrame = None,
         read_only: bool = False,
 ) -> pd.DataFrame:
-    lst = []
-    # write chunks to csv
-    for idx, chunk in enumerate(chunks):
-        loop = asyncio.get_event_loop()
-        df = loop.run_until_complete(func(chunk))
-        if not read_only:
-            df.to_csv(f"{dirname}/{base_filename}{idx}.csv", index=False)
-        else:
-            lst.append(df)
+    # collect the chunk results in memory and combine them in a single pass
+    loop = asyncio.get_event_loop()
+    lst = [loop.run_until_complete(func(chunk)) for chunk in chunks]
 
-    filepaths = glob(f"{dirname}/*.csv")
+    if not lst:
+        return df_combined
 
     if not read_only:
-        # concatenate and deduplicate
-
-        if filepaths:
-            df_orig = df_combined.copy() if df_combined is not None else None
-            df_combined = pd.concat([pd.read_csv(filepath) for filepath in filepaths])
-            df_combined = (
-                pd.concat([df_orig, df_combined]) if df_orig is not None else df_combined
-            )
-            df_combined = df_combined.drop_duplicates(subset=subset)
-            df_combined.to_csv(filename, index=False)
-            # clear temp dir
-            for filepath in filepaths:
-                try:
-                    os.remove(filepath)
-                except Exception as e:
-                    cfg.logger.error(f"Failed to remove {filepath} {e}??? This is spooky...")
+        # concatenate and deduplicate, then write the combined result once
+        df_combined = pd.concat([df_combined, *lst]) if df_combined is not None else pd.concat(lst)
+        df_combined = df_combined.drop_duplicates(subset=subset)
+        df_combined.to_csv(filename, index=False)
     else:
-        if lst:
-            dfs = pd.concat(lst)
-            dfs = dfs.drop_duplicates(subset=subset)
-            if df_combined is not None:
-                df_combined = pd.concat([df_combined, dfs])
-            else:
-                df_combined = dfs
+        dfs = pd.concat(lst)
+        dfs = dfs.drop_duplicates(subset=subset)
+        if df_combined is not None:
+            df_combined = pd.concat([df_combined, dfs])
+        else:
+            df_combined = dfs
 
     return df_combined
 
@@ -381,7 +361,6 @@ def get_pool_contracts(mgr: Any) -> List[Dict[str, Any]]:
 def async_update_pools_from_contracts(mgr: Any, current_block: int, logging_path):
     global cfg
     cfg = mgr.cfg
-    dirname = "temp"
     keys = [
         "liquidity",
         "tkn0_balance",
@@ -390,9 +369,6 @@ def async_update_pools_from_contracts(mgr: Any, current_block: int, logging_path
         "y_1",
         "liquidity",
     ]
-    if not mgr.read_only:
-        if not os.path.exists(dirname):
-            os.mkdir(dirname)
     start_time = time.time()
     # deplicate pool data
 
@@ -408,9 +384,7 @@ def async_update_pools_from_contracts(mgr: Any, current_block: int, logging_path
     contracts = get_pool_contracts(mgr)
     chunks = get_contract_chunks(contracts)
     tokens_and_fee_df = process_contract_chunks(
-        base_filename="tokens_and_fee_df_",
         chunks=chunks,
-        dirname=dirname,
         filename="tokens_and_fee_df.csv",
         subset=["exchange_name", "address", "cid", "tkn0_address", "tkn1_address"],
         func=main_get_tokens_and_fee,
@@ -419,15 +393,11 @@ def async_update_pools_from_contracts(mgr: Any, current_block: int, logging_path
 
     contracts, tokens_df = get_token_contracts(mgr, tokens_and_fee_df)
     tokens_df = process_contract_chunks(
-        base_filename="missing_tokens_df_",
         chunks=get_contract_chunks(contracts),
-        dirname=dirname,
         filename="missing_tokens_df.csv",
         subset=["address"],
         func=main_get_missing_tkn,
-        df_combined=pd.read_csv(
-            f"fastlane_bot/data/blockchain_data/{mgr.blockchain}/tokens.csv"
-        ),
+        df_combined=tokens_df,  # tokens.csv as already loaded by get_token_contracts
         read_only=mgr.read_only,
     )
     tokens_df["symbol"] = (
@@ -475,10 +445,12 @@ def async_update_pools_from_contracts(mgr: Any, current_block: int, logging_path
 
     # Initialize web3
     new_pool_data_df["cid"] = [
-        cfg.w3.keccak(text=f"{row['descr']}").hex()
-        if row["exchange_name"] not in mgr.cfg.CARBON_V1_FORKS
-        else int(row['cid'])
-        for index, row in new_pool_data_df.iterrows()
+        cfg.w3.keccak(text=f"{descr}").hex()
+        if exchange_name not in mgr.cfg.CARBON_V1_FORKS
+        else int(cid)
+        for descr, exchange_name, cid in zip(
+            new_pool_data_df["descr"], new_pool_data_df["exchange_name"], new_pool_data_df["cid"]
+        )
     ]
 
     # print duplicate cid rows
@@ -97,6 +97,7 @@ class BaseManager:
     SUPPORTED_EXCHANGES: List[str] = None
     SUPPORTED_BASE_EXCHANGES: List[str] = None
     _fee_pairs: Dict[Tuple[str, str], int] = field(default_factory=dict)
+    _event_format_candidates: List[Tuple[str, Any]] = field(default_factory=list)
     carbon_inititalized: bool = None
     replay_from_block: int = None
 
@@ -124,6 +125,15 @@ class BaseManager:
             if base_exchange_name in "solidly_v2":
                 self.exchanges[exchange_name] = self.handle_solidly_exchanges(exchange=self.exchanges[exchange_name])
 
+        # the (exchange name, pool class) pairs to test events against only depend on static config,
+        # so resolve them once here rather than on every call to exchange_name_from_event
+        self._event_format_candidates = [
+            (_ex_name, pool_class)
+            for exchange_name, pool_class in pool_factory._creators.items()
+            for _ex_name in self.SUPPORTED_EXCHANGES
+            if exchange_name in self.cfg.network.exchange_name_base_from_fork(_ex_name)
+        ]
+
         self.init_exchange_contracts()
         self.set_carbon_v1_fee_pairs()
         self.init_tenderly_event_contracts()
@@ -239,12 +249,9 @@ class BaseManager:
             The exchange name.
         """
 
-        for exchange_name, pool_class in pool_factory._creators.items():
-            for _ex_name in self.SUPPORTED_EXCHANGES:
-                if exchange_name not in self.cfg.network.exchange_name_base_from_fork(_ex_name):
-                    continue
-                if pool_class.event_matches_format(event, self.static_pools, exchange_name=_ex_name):
-                    return _ex_name
+        for _ex_name, pool_class in self._event_format_candidates:
+            if pool_class.event_matches_format(event, self.static_pools, exchange_name=_ex_name):
+                return _ex_name
         return None
 
     def check_forked_exchange_names(
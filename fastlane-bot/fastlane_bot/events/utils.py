@@ -15,7 +15,6 @@ from glob import glob
 from typing import Any, Union, Dict, Set, Tuple, Hashable
 from typing import List
 
-import numpy as np
 import pandas as pd
 import requests
 from hexbytes import HexBytes
@@ -25,18 +24,15 @@ from web3.datastructures import AttributeDict
 
 from fastlane_bot import Config
 from fastlane_bot.bot import CarbonBot
-from fastlane_bot.config.connect import NetworkBase
-from fastlane_bot.config.multiprovider import MultiProviderContractWrapper
 from fastlane_bot.data.abi import FAST_LANE_CONTRACT_ABI
 from fastlane_bot.events.exceptions import ReadOnlyException
 from fastlane_bot.events.interface import QueryInterface
 from fastlane_bot.events.managers.manager import Manager
-
-from fastlane_bot.events.multicall_utils import encode_token_price
-from fastlane_bot.events.pools import CarbonV1Pool
 from fastlane_bot.helpers import TxHelpers
 from fastlane_bot.utils import safe_int
 
+EVENT_MAPPINGS_FILENAME = "{fork}_event_mappings.csv"
+
 
 def filter_latest_events(
     mgr: Manager, events: List[List[AttributeDict]]
@@ -154,7 +150,7 @@ def complex_handler(obj: Any) -> Union[Dict, str, List, Set, Any]:
         return obj
 
 
-def add_initial_pool_data(cfg: Config, mgr: Any, n_jobs: int = -1):
+def add_initial_pool_data(cfg: Config, mgr: Any):
     """
     Adds initial pool data to the manager.
 
@@ -164,15 +160,13 @@ def add_initial_pool_data(cfg: Config, mgr: Any, n_jobs: int = -1):
         The config object.
     mgr : Any
         The manager object.
-    n_jobs : int, optional
-        The number of jobs to run in parallel, by default -1
 
     """
-    # Add initial pools for each row in the static_pool_data
+    # Add initial pools for each row in the static_pool_data; this is pure in-memory work that holds the GIL,
+    # so a plain loop is faster than dispatching each row to a thread pool
     start_time = time.time()
-    Parallel(n_jobs=n_jobs, backend="threading")(
-        delayed(mgr.add_pool_to_exchange)(row) for row in mgr.pool_data
-    )
+    for row in mgr.pool_data:
+        mgr.add_pool_to_exchange(row)
     cfg.logger.debug(
         f"[events.utils] Time taken to add initial pools: {time.time() - start_time}"
     )
@@ -280,24 +274,14 @@ def get_static_data(
         static_pool_data["exchange_name"].isin(exchanges)
     ]
 
-    # Read Uniswap v2 event mappings and tokens
-    uniswap_v2_filepath = os.path.join(base_path, "uniswap_v2_event_mappings.csv")
-    uniswap_v2_event_mappings_df = read_csv_file(uniswap_v2_filepath)
-    uniswap_v2_event_mappings = dict(
-        uniswap_v2_event_mappings_df[["address", "exchange"]].values
-    )
-
-    # Read Uniswap v3 event mappings and tokens
-    uniswap_v3_filepath = os.path.join(base_path, "uniswap_v3_event_mappings.csv")
-    uniswap_v3_event_mappings_df = read_csv_file(uniswap_v3_filepath)
-    uniswap_v3_event_mappings = dict(
-        uniswap_v3_event_mappings_df[["address", "exchange"]].values
-    )
-    # Read Solidly v2 event mappings and tokens
-    solidly_v2_filepath = os.path.join(base_path, "solidly_v2_event_mappings.csv")
-    solidly_v2_event_mappings_df = read_csv_file(solidly_v2_filepath)
-    solidly_v2_event_mappings = dict(
-        solidly_v2_event_mappings_df[["address", "exchange"]].values
+    # Read the Uniswap v2, Uniswap v3 and Solidly v2 event mappings
+    uniswap_v2_event_mappings, uniswap_v3_event_mappings, solidly_v2_event_mappings = (
+        dict(
+            read_csv_file(
+                os.path.join(base_path, EVENT_MAPPINGS_FILENAME.format(fork=fork))
+            )[["address", "exchange"]].values
+        )
+        for fork in ("uniswap_v2", "uniswap_v3", "solidly_v2")
     )
 
     tokens_filepath = os.path.join(base_path, "tokens.csv")
@@ -319,31 +303,21 @@ def get_static_data(
         .str.replace("-", "_")
     )
 
-    def correct_tkn(tkn_address, keyname):
-        try:
-            return tokens[tokens["address"] == tkn_address][keyname].values[0]
-        except IndexError:
-            return np.nan
-
     static_pool_data["tkn0_address"] = static_pool_data["tkn0_address"].apply(
         lambda x: Web3.to_checksum_address(x)
     )
     static_pool_data["tkn1_address"] = static_pool_data["tkn1_address"].apply(
         lambda x: Web3.to_checksum_address(x)
     )
-    static_pool_data["tkn0_decimals"] = static_pool_data["tkn0_address"].apply(
-        lambda x: correct_tkn(x, "decimals")
-    )
-    static_pool_data["tkn1_decimals"] = static_pool_data["tkn1_address"].apply(
-        lambda x: correct_tkn(x, "decimals")
-    )
 
-    static_pool_data["tkn0_symbol"] = static_pool_data["tkn0_address"].apply(
-        lambda x: correct_tkn(x, "symbol")
-    )
-    static_pool_data["tkn1_symbol"] = static_pool_data["tkn1_address"].apply(
-        lambda x: correct_tkn(x, "symbol")
-    )
+    # addresses are unique after drop_duplicates, so a single indexed map per column
+    # replaces the per-row boolean mask lookups; unknown addresses map to NaN
+    tokens_by_address = tokens.set_index("address")
+    for i in (0, 1):
+        tkn_addresses = static_pool_data[f"tkn{i}_address"]
+        static_pool_data[f"tkn{i}_decimals"] = tkn_addresses.map(tokens_by_address["decimals"])
+        static_pool_data[f"tkn{i}_symbol"] = tkn_addresses.map(tokens_by_address["symbol"])
+
     static_pool_data["pair_name"] = (
         static_pool_data["tkn0_address"] + "/" + static_pool_data["tkn1_address"]
     )
@@ -368,8 +342,7 @@ def get_static_data(
     )
     # Initialize web3
     static_pool_data["cid"] = [
-        cfg.w3.keccak(text=f"{row['descr']}").hex()
-        for index, row in static_pool_data.iterrows()
+        cfg.w3.keccak(text=f"{descr}").hex() for descr in static_pool_data["descr"]
     ]
 
     static_pool_data = static_pool_data.drop_duplicates(subset=["cid"])
@@ -698,19 +671,21 @@ def get_event_filters(
     bancor_pol_events = ["TradingEnabled", "TokenTraded"]
 
     # Get for exchanges except POL contract
-    by_block_events = Parallel(n_jobs=n_jobs, backend="threading")(
+    by_block_events = [
         delayed(event.create_filter)(fromBlock=start_block, toBlock=current_block)
         for event in mgr.events
         if event.__name__ not in bancor_pol_events
-    )
+    ]
 
     # Get all events since the beginning of time for Bancor POL contract
-    max_num_events = Parallel(n_jobs=n_jobs, backend="threading")(
+    max_num_events = [
         delayed(event.create_filter)(fromBlock=0, toBlock="latest")
         for event in mgr.events
         if event.__name__ in bancor_pol_events
-    )
-    return by_block_events + max_num_events
+    ]
+
+    # the filters are independent, so create them all in a single parallel batch
+    return Parallel(n_jobs=n_jobs, backend="threading")(by_block_events + max_num_events)
 
 
 def get_all_events(n_jobs: int, event_filters: Any) -> List[Any]:
@@ -746,17 +721,26 @@ def get_all_events(n_jobs: int, event_filters: Any) -> List[Any]:
     )
 
 
-def convert_to_serializable(data: Any) -> Any:
+def serialize_for_json(data: Any) -> Any:
+    """
+    ``default`` hook for ``json.dumps``; only called for objects the json encoder cannot handle natively,
+    so the traversal of nested dicts and lists stays inside the (C) encoder.
+
+    Parameters
+    ----------
+    data : Any
+        The object the encoder could not serialize.
+
+    Returns
+    -------
+    Any
+        A base64 string for bytes, or the object's attribute dict, which the encoder then traverses.
+    """
     if isinstance(data, bytes):
         return base64.b64encode(data).decode("ascii")
-    elif isinstance(data, dict):
-        return {key: convert_to_serializable(value) for key, value in data.items()}
-    elif isinstance(data, list):
-        return [convert_to_serializable(item) for item in data]
     elif hasattr(data, "__dict__"):
-        return convert_to_serializable(data.__dict__)
-    else:
-        return data
+        return data.__dict__
+    raise TypeError(f"Object of type {type(data).__name__} is not JSON serializable")
 
 
 def save_events_to_json(
@@ -796,11 +780,11 @@ def save_events_to_json(
     try:
         with open(path, "w") as f:
             # Remove contextId from the latest events
-            latest_events = convert_to_serializable(latest_events)
             # latest_events = [
             #     _["args"].pop("contextId", None) for _ in latest_events
             # ] and latest_events
-            f.write(json.dumps(latest_events))
+            # compact separators; the cached events are only read back by machines
+            f.write(json.dumps(latest_events, default=serialize_for_json, separators=(",", ":")))
             mgr.cfg.logger.info(f"Saved events to {path}")
     except Exception as e:
         mgr.cfg.logger.warning(
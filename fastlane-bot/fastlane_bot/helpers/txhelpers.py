@@ -183,6 +183,8 @@ class TxHelpers:
         self.wallet_address = str(self.local_account.address)
 
         self.alchemy_api_url = self.ConfigObj.RPC_URL
+        # reuse one keep-alive connection for the repeated JSON-RPC posts to the provider
+        self.http_session = requests.Session()
         self.nonce = self.get_nonce()
 
     def _get_transaction_info(self) -> (int, int, int, int):
@@ -383,7 +385,7 @@ class TxHelpers:
                 ],
             }
         )
-        response = requests.post(self.alchemy_api_url, json=json_data)
+        response = self.http_session.post(self.alchemy_api_url, json=json_data)
         if "failed to apply transaction" in response.text:
             return None
         else:
@@ -693,7 +695,7 @@ class TxHelpers:
 
         :param method: the API method to call
         """
-        response = requests.post(
+        response = self.http_session.post(
             self.alchemy_api_url,
             json=self._get_payload(method=method, params=params),
             headers=self._get_headers,
@@ -8,12 +8,14 @@
 
 
 
+import json
+
 from web3.datastructures import AttributeDict
 from web3.types import HexBytes
 
 from fastlane_bot import Bot
 from fastlane_bot.events.pools import UniswapV2Pool, UniswapV3Pool, BancorV3Pool, CarbonV1Pool
-from fastlane_bot.events.utils import filter_latest_events, complex_handler
+from fastlane_bot.events.utils import filter_latest_events, complex_handler, serialize_for_json
 from fastlane_bot.tools.cpc import ConstantProductCurve as CPC
 
 print("{0.__name__} v{0.__VERSION__} ({0.__DATE__})".format(CPC))
@@ -85,4 +87,18 @@ def test_test_complex_handler():
     assert (complex_handler(list_) == [1, '0x68656c6c6f', {'d': 4}])
     set_ = {1, 2, 3}
     assert (complex_handler(set_) == [1, 2, 3])
-    assert (complex_handler(123) == 123)
\ No newline at end of file
+    assert (complex_handler(123) == 123)
+    
+
+# ------------------------------------------------------------
+# Test      035
+# File      test_035_Utils.py
+# Segment   test_serialize_for_json
+# ------------------------------------------------------------
+def test_test_serialize_for_json():
+# ------------------------------------------------------------
+    
+    events = [AttributeDict({'a': 1, 'b': b'hello', 'c': [AttributeDict({'d': b'hi'})]})]
+    assert (json.dumps(events, default=serialize_for_json) == '[{"a": 1, "b": "aGVsbG8=", "c": [{"d": "aGk="}]}]')
+    assert (serialize_for_json(b'hello') == 'aGVsbG8=')
+    assert (raises(serialize_for_json, 123) == "Object of type int is not JSON serializable")
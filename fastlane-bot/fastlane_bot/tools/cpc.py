@@ -19,7 +19,6 @@ from math import sqrt
 import numpy as np
 import pandas as pd
 import json
-from matplotlib import pyplot as plt
 from .params import Params
 import itertools as it
 import collections as cl
@@ -2587,6 +2586,8 @@ class CPCContainer:
         :directed:  if True, only plot pairs provided; otherwise plot reverse pairs as well
         :params:    plot parameters, as params struct (see PLOTPARAMS)
         """
+        from matplotlib import pyplot as plt  # deferred; only needed for plotting, not by the bot
+
         p = Params.construct(params, defaults=self.PLOTPARAMS.params)
 
         if pairs is None:
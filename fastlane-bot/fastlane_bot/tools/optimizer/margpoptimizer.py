@@ -65,10 +65,12 @@ class MargPOptimizer(CPCArbOptimizer):
         n = len(x)
         y = func(x, quiet=True)
         jac = np.zeros((n, n))
+        x_plus = np.array(x, dtype=np.float64)  # single buffer, bumped one coordinate at a time
         for j in range(n):  # through columns to allow for vector addition
             Dxj = abs(x[j]) * eps if x[j] != 0 else eps
-            x_plus = [(xi if k != j else xi + Dxj) for k, xi in enumerate(x)]
+            x_plus[j] = x[j] + Dxj
             jac[:, j] = (func(x_plus, quiet=True) - y) / Dxj
+            x_plus[j] = x[j]
         return jac
     J = jacobian
     JACEPS = 1e-5
@@ -158,6 +160,7 @@ class MargPOptimizer(CPCArbOptimizer):
         # initialisations
         eps = P("eps") or self.MOEPS
         maxiter = P("maxiter") or self.MOMAXITER
+        debug, debug2 = P("debug"), P("debug2")                    # resolved once, not per call
         start_time = time.time()
         curves_t = self.curve_container
         alltokens_s = self.curve_container.tokens()
@@ -236,7 +239,9 @@ class MargPOptimizer(CPCArbOptimizer):
                 if islog10:
                     p = np.exp(p * np.log(10))
                 assert len(p) == len(tokens_t), f"p and tokens_t have different lengths [{p}, {tokens_t}]"
-                if P("debug") and not quiet:
+                trace = debug and not quiet
+                trace2 = debug2 and not quiet
+                if trace:
                     print(f"\n[dtknfromp_f] =====================>>>")
                     print(f"prices={p}")
                     print(f"tokens={tokens_t}")
@@ -244,7 +249,7 @@ class MargPOptimizer(CPCArbOptimizer):
                 # pvec is dict {tkn -> (log) price} for all tokens in p
                 pvec = {tkn: p_ for tkn, p_ in zip(tokens_t, p)}
                 pvec[targettkn] = 1
-                if P("debug") and not quiet:
+                if trace:
                     print(f"pvec={pvec}")
                 
                 sum_by_tkn = {t: 0 for t in alltokens_s}
@@ -259,7 +264,7 @@ class MargPOptimizer(CPCArbOptimizer):
                     #dxdy = tuple(dxdy_f(c.dxdyfromp_f(price)) for c in curves)
                     dxvecs = (c.dxvecfrompvec_f(pvec) for c in curves)
                     
-                    if P("debug2") and not quiet:
+                    if trace2:
                         dxdy = tuple(dxdy_f(c.dxdyfromp_f(price)) for c in curves)
                             # TODO: rewrite this using the dxvec
                             # there is no need to extract dy dx; just iterate over dict
@@ -286,7 +291,7 @@ class MargPOptimizer(CPCArbOptimizer):
                     #     print(f"pair={c0.pairp}, {sumdy:,.4f} {tn(tknq)}, {sumdx:,.4f} {tn(tknb)}, price={price:,.4f} {tn(tknq)} per {tn(tknb)} [{len(curves)} funcs]")
 
                 result = tuple(sum_by_tkn[t] for t in tokens_t)
-                if P("debug") and not quiet:
+                if trace:
                     print(f"sum_by_tkn={sum_by_tkn}")
                     print(f"result={result}")
                     print(f"<<<===================== [dtknfromp_f]")
@@ -6,22 +6,19 @@ Licensed under MIT
 """
 import datetime
 import glob
-import logging
+import json
 import math
 import os.path
-import time
 from _decimal import Decimal
 from dataclasses import dataclass
 from hexbytes import HexBytes
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Any
 
-import pandas as pd
 import requests
 from web3 import Web3
 from web3.contract import Contract
 
 from fastlane_bot.config import config as cfg
-from fastlane_bot.data.abi import *
 
 
 def safe_int(value: int or float) -> int:
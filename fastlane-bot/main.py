@@ -12,6 +12,7 @@ from fastlane_bot.tools.cpc import T
 
 check_version_requirements(required_version="6.11.0", package_name="web3")
 
+import gc
 import os, sys
 import time
 from traceback import format_exc
@@ -294,7 +295,7 @@ def main(args: argparse.Namespace) -> None:
     )
 
     # Add initial pool data to the manager
-    add_initial_pool_data(cfg, mgr, args.n_jobs)
+    add_initial_pool_data(cfg, mgr)
 
     # Run the main loop
     run(mgr, args)
@@ -461,6 +462,10 @@ def run(mgr, args, tenderly_uri=None) -> None:
                 forked_from_block=forked_from_block,
             )
 
+            # The bot and the state snapshot are rebuilt every iteration; release them here so they are
+            # not kept alive across the polling sleep and the memory-heavy terraforming step below
+            del bot, initial_state
+
             # Sleep for the polling interval
             if not replay_from_block and args.polling_interval > 0:
                 mgr.cfg.logger.info(
@@ -521,6 +526,7 @@ def run(mgr, args, tenderly_uri=None) -> None:
                     if loop_idx > 1
                     else None
                 )
+                gc.collect()
                 (
                     exchange_df,
                     uniswap_v2_event_mappings,